@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Callable, Dict
+from typing import Callable, Dict, Tuple
 
 try:
     import sounddevice as sd
@@ -29,6 +29,8 @@ class MicStream:
         self._stream = None
         self._lock = threading.Lock()
         self._listeners: Dict[int, MicCallback] = {}
+        # Rebuilt under the lock on (un)subscribe; the audio callback reads it lock-free.
+        self._listeners_snapshot: Tuple[MicCallback, ...] = ()
         self._next_listener_id = 1
         self._started = False
 
@@ -37,16 +39,16 @@ class MicStream:
             token = self._next_listener_id
             self._next_listener_id += 1
             self._listeners[token] = callback
+            self._listeners_snapshot = tuple(self._listeners.values())
             return token
 
     def unsubscribe(self, token: int) -> None:
         with self._lock:
             self._listeners.pop(token, None)
+            self._listeners_snapshot = tuple(self._listeners.values())
 
     def _dispatch(self, data: bytes) -> None:
-        with self._lock:
-            listeners = list(self._listeners.values())
-        for cb in listeners:
+        for cb in self._listeners_snapshot:
             try:
                 cb(data)
             except Exception:
@@ -63,9 +65,12 @@ class MicStream:
                 logger.warning("Mic status: %s", status)
             if frames <= 0:
                 return
+            # RawInputStream hands us the PortAudio buffer directly (no NumPy array per block).
+            # Take exactly one immutable copy: listeners queue it across threads, so the
+            # callback buffer cannot be lent out or recycled.
             self._dispatch(bytes(indata))
 
-        self._stream = sd.InputStream(
+        self._stream = sd.RawInputStream(
             samplerate=self.sample_rate,
             channels=self.channels,
             dtype="int16",
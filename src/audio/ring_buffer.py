@@ -1,30 +1,47 @@
 from __future__ import annotations
 
 import queue
-from typing import Optional
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional
 
 
 class RingBuffer:
     def __init__(self, max_chunks: int = 256) -> None:
-        self._q: "queue.Queue[bytes]" = queue.Queue(maxsize=max_chunks)
+        # deque append/popleft are atomic under the GIL and maxlen drops the oldest chunk on overflow.
+        self._q: Deque[bytes] = deque(maxlen=max_chunks)
+        self._ready = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._q)
 
     def put(self, chunk: bytes) -> None:
+        self._q.append(chunk)
+        self._ready.set()
+
+    def get_nowait(self) -> bytes:
         try:
-            self._q.put_nowait(chunk)
-        except queue.Full:
-            try:
-                _ = self._q.get_nowait()
-            except queue.Empty:
-                pass
-            self._q.put_nowait(chunk)
+            return self._q.popleft()
+        except IndexError:
+            raise queue.Empty from None
 
     def get(self, timeout: Optional[float] = None) -> bytes:
-        return self._q.get(timeout=timeout)
-
-    def clear(self) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
         while True:
             try:
-                self._q.get_nowait()
-            except queue.Empty:
-                break
+                return self._q.popleft()
+            except IndexError:
+                pass
+            self._ready.clear()
+            # A put may have landed between popleft and clear; re-check before sleeping.
+            if self._q:
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            if not self._ready.wait(remaining) and not self._q:
+                raise queue.Empty
 
+    def clear(self) -> None:
+        self._q.clear()
@@ -1,15 +1,10 @@
 from __future__ import annotations
 
 import logging
-import queue
-import threading
-from typing import Optional
 
 try:
-    import numpy as np
     import sounddevice as sd
 except Exception:  # pragma: no cover
-    np = None
     sd = None
 
 
@@ -17,34 +12,51 @@ logger = logging.getLogger(__name__)
 
 
 class SpeakerPlayer:
-    def __init__(self, sample_rate: int, channels: int, chunk_frames: int, device=None) -> None:
+    def __init__(
+        self,
+        sample_rate: int,
+        channels: int,
+        chunk_frames: int,
+        device=None,
+        buffer_sec: float = 60.0,
+    ) -> None:
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_frames = chunk_frames
         self.device = device
-        self._q: "queue.Queue[bytes]" = queue.Queue(maxsize=512)
         self._stream = None
         self._started = False
-        self._buf = bytearray()
-        self._buf_lock = threading.Lock()
+        # Realtime deltas arrive faster than playback, so the ring must hold a whole reply.
+        self._ring = bytearray(int(sample_rate * buffer_sec) * channels * 2)
+        self._view = memoryview(self._ring)
+        # Lock-free SPSC ring: monotonic byte counters, each written by one side only.
+        # _write_pos belongs to enqueue() (WS thread), _read_pos to the output callback;
+        # clear() only publishes _clear_pos, which the callback skips to on its next read.
+        # Correctness relies on the GIL making each counter store atomic and ordered.
+        self._write_pos = 0
+        self._read_pos = 0
+        self._clear_pos = 0
+        # Zero block for underruns; a memoryview so slicing it does not allocate a copy.
+        self._silence = memoryview(bytes(chunk_frames * channels * 2 * 4))
 
     def start(self) -> None:
         if self._started:
             return
-        if sd is None or np is None:
-            raise RuntimeError("sounddevice/numpy is not installed")
+        if sd is None:
+            raise RuntimeError("sounddevice is not installed")
 
         def _callback(outdata, frames, time_info, status) -> None:
             if status:
                 logger.warning("Speaker status: %s", status)
             needed_bytes = frames * self.channels * 2
-            chunk = self._read_bytes(needed_bytes)
-            if len(chunk) < needed_bytes:
-                chunk += b"\x00" * (needed_bytes - len(chunk))
-            arr = np.frombuffer(chunk, dtype=np.int16).reshape(frames, self.channels)
-            outdata[:] = arr
+            n = self._read_into(outdata, needed_bytes)
+            missing = needed_bytes - n
+            if missing > 0:
+                if missing > len(self._silence):
+                    self._silence = memoryview(bytes(missing))
+                outdata[n:needed_bytes] = self._silence[:missing]
 
-        self._stream = sd.OutputStream(
+        self._stream = sd.RawOutputStream(
             samplerate=self.sample_rate,
             channels=self.channels,
             dtype="int16",
@@ -56,33 +68,40 @@ class SpeakerPlayer:
         self._started = True
         logger.info("Speaker player started (rate=%s, chunk=%s)", self.sample_rate, self.chunk_frames)
 
-    def _read_bytes(self, n: int) -> bytes:
-        with self._buf_lock:
-            while len(self._buf) < n:
-                try:
-                    self._buf.extend(self._q.get_nowait())
-                except queue.Empty:
-                    break
-            data = bytes(self._buf[:n])
-            del self._buf[:n]
-            return data
+    def _read_into(self, out, n: int) -> int:
+        read_pos = max(self._read_pos, self._clear_pos)
+        n = min(n, self._write_pos - read_pos)
+        if n <= 0:
+            self._read_pos = read_pos
+            return 0
+        cap = len(self._ring)
+        head = read_pos % cap
+        first = min(n, cap - head)
+        out[:first] = self._view[head : head + first]
+        if first < n:
+            out[first:n] = self._view[: n - first]
+        self._read_pos = read_pos + n
+        return n
 
     def enqueue(self, pcm_bytes: bytes) -> None:
-        if not pcm_bytes:
+        n = len(pcm_bytes)
+        if n == 0:
             return
-        try:
-            self._q.put_nowait(pcm_bytes)
-        except queue.Full:
-            logger.warning("Speaker queue full, dropping audio chunk")
+        cap = len(self._ring)
+        write_pos = self._write_pos
+        if n > cap - (write_pos - max(self._read_pos, self._clear_pos)):
+            logger.warning("Speaker buffer full, dropping audio chunk")
+            return
+        src = memoryview(pcm_bytes)
+        tail = write_pos % cap
+        first = min(n, cap - tail)
+        self._view[tail : tail + first] = src[:first]
+        if first < n:
+            self._view[: n - first] = src[first:]
+        self._write_pos = write_pos + n
 
     def clear(self) -> None:
-        with self._buf_lock:
-            self._buf.clear()
-        while True:
-            try:
-                self._q.get_nowait()
-            except queue.Empty:
-                break
+        self._clear_pos = self._write_pos
 
     def stop(self) -> None:
         if not self._started:
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import base64
+import binascii
 import json
 import logging
 import queue
 import threading
-from typing import Callable, Optional
+from typing import Callable, Optional, Sequence, Union
 
+from ..audio.ring_buffer import RingBuffer
 from .realtime_protocol import (
     build_input_audio_append,
     build_input_audio_commit,
@@ -19,17 +20,52 @@ try:
 except Exception:  # pragma: no cover
     websocket = None
 
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 EventSink = Callable[[str, dict], None]
 
+# Decoded assistant audio is handed to the speaker in blocks of at least this many bytes.
+_AUDIO_FLUSH_BYTES = 4096
+# Mic chunks already waiting in the queue are merged into one append event, up to this many.
+_SEND_BATCH_CHUNKS = 3
+# A backlog is drained into at most this many append frames, all sent under one lock acquisition.
+_SEND_MAX_FRAMES = 4
+_AUDIO_DELTA_TYPES = frozenset({"response.audio.delta", "response.output_audio.delta"})
+_AUDIO_DONE_TYPES = frozenset({"response.audio.done", "response.output_audio.done", "response.done"})
+# High-rate streaming events that never drive a state transition; kept out of the event sink.
+_IGNORED_RESPONSE_EVENTS = frozenset(
+    {
+        "response.audio.delta",
+        "response.output_audio.delta",
+        "response.audio_transcript.delta",
+        "response.output_audio_transcript.delta",
+    }
+)
+
+if orjson is not None:
+    _ENCODE = orjson.dumps
+    _DECODE = orjson.loads
+else:
+    _json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def _ENCODE(payload: dict) -> bytes:
+        return _json_encode(payload).encode("utf-8")
+
+    _DECODE = json.loads
+
 
 class RealtimeClient:
     def __init__(self, config, speaker_player, event_sink: EventSink) -> None:
         self.config = config
         self.speaker_player = speaker_player
         self.event_sink = event_sink
-        self._audio_q: "queue.Queue[bytes]" = queue.Queue(maxsize=1024)
+        self._audio_q = RingBuffer(max_chunks=1024)
+        self._audio_accum = bytearray()
         self._stop = threading.Event()
         self._send_lock = threading.Lock()
         self._ws_app = None
@@ -51,10 +87,7 @@ class RealtimeClient:
     def send_audio(self, pcm_bytes: bytes) -> None:
         if self._stop.is_set():
             return
-        try:
-            self._audio_q.put_nowait(pcm_bytes)
-        except queue.Full:
-            logger.warning("Realtime audio queue full, dropping chunk")
+        self._audio_q.put(pcm_bytes)
 
     def close(self) -> None:
         self._stop.set()
@@ -83,9 +116,12 @@ class RealtimeClient:
             logger.info("Realtime WS opened")
 
         def on_message(ws, message: str) -> None:
+            # Audio deltas dominate the stream; with debug logging on, everything takes the full parse.
+            if not logger.isEnabledFor(logging.DEBUG) and self._handle_audio_delta_text(message):
+                return
             try:
-                data = json.loads(message)
-            except json.JSONDecodeError:
+                data = _DECODE(message)
+            except ValueError:
                 logger.debug("Non-JSON WS message received")
                 return
             self._handle_message(data)
@@ -114,6 +150,7 @@ class RealtimeClient:
             self._emit("realtime.error", {"error": str(exc)})
 
     def _run_sender(self) -> None:
+        max_chunks = _SEND_BATCH_CHUNKS * _SEND_MAX_FRAMES
         while not self._stop.is_set():
             try:
                 pcm_bytes = self._audio_q.get(timeout=0.2)
@@ -121,22 +158,43 @@ class RealtimeClient:
                 continue
             if not self._connected.is_set():
                 continue
-            self._send_json(build_input_audio_append(pcm_bytes))
+            pending = [pcm_bytes]
+            while len(pending) < max_chunks:
+                try:
+                    pending.append(self._audio_q.get_nowait())
+                except queue.Empty:
+                    break
+            frames = [
+                build_input_audio_append(b"".join(pending[i : i + _SEND_BATCH_CHUNKS]))
+                for i in range(0, len(pending), _SEND_BATCH_CHUNKS)
+            ]
+            self._send_frames(frames)
+
+    def _send_json(self, payload: Union[dict, bytes, bytearray]) -> None:
+        # Text frames are always handed over as UTF-8 bytes so websocket-client never re-encodes.
+        # Pre-serialized frames from realtime_protocol are ASCII and go out as-is.
+        if isinstance(payload, (bytes, bytearray)):
+            data = payload
+        else:
+            data = _ENCODE(payload)
+        self._send_frames((data,))
 
-    def _send_json(self, payload: dict) -> None:
-        text = json.dumps(payload, ensure_ascii=False)
+    def _send_frames(self, frames: Sequence[Union[bytes, bytearray]]) -> None:
         ws = self._ws_app
         if ws is None:
             return
         with self._send_lock:
-            try:
-                ws.send(text)
-            except Exception:
-                logger.exception("WS send failed")
+            for data in frames:
+                try:
+                    ws.send(data, websocket.ABNF.OPCODE_TEXT)
+                except Exception:
+                    logger.exception("WS send failed")
+                    return
 
     def _handle_message(self, data: dict) -> None:
         event_type = data.get("type", "")
-        logger.debug("Realtime event=%s", event_type)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Realtime event=%s", event_type)
 
         if event_type == "session.created":
             self._connected.set()
@@ -152,6 +210,7 @@ class RealtimeClient:
             return
 
         if event_type == "input_audio_buffer.speech_started":
+            self._audio_accum.clear()
             self.speaker_player.clear()
             return
 
@@ -162,20 +221,45 @@ class RealtimeClient:
 
         audio_b64 = self._extract_audio_b64(data)
         if audio_b64:
-            try:
-                self.speaker_player.enqueue(base64.b64decode(audio_b64))
-            except Exception:
-                logger.exception("Failed to decode audio delta")
+            self._accept_audio_delta(audio_b64)
+        if event_type in _AUDIO_DONE_TYPES:
+            self._flush_audio()
 
-        if event_type.startswith("response."):
+        if event_type.startswith("response.") and event_type not in _IGNORED_RESPONSE_EVENTS:
             self._emit("realtime.response_event", {"type": event_type})
 
+    def _handle_audio_delta_text(self, message: str) -> bool:
+        head = message[:120]
+        if '"response.output_audio.delta"' not in head and '"response.audio.delta"' not in head:
+            return False
+        _, found, tail = message.partition('"delta":"')
+        if not found:
+            return False
+        audio_b64, found, _ = tail.partition('"')
+        if not found:
+            return False
+        self._accept_audio_delta(audio_b64)
+        return True
+
+    def _accept_audio_delta(self, audio_b64: str) -> None:
+        try:
+            self._audio_accum += binascii.a2b_base64(audio_b64)
+        except (binascii.Error, ValueError):
+            logger.exception("Failed to decode audio delta")
+            return
+        if len(self._audio_accum) >= _AUDIO_FLUSH_BYTES:
+            self._flush_audio()
+
+    def _flush_audio(self) -> None:
+        if self._audio_accum:
+            self.speaker_player.enqueue(bytes(self._audio_accum))
+            self._audio_accum.clear()
+
     @staticmethod
     def _extract_audio_b64(data: dict) -> Optional[str]:
-        event_type = data.get("type", "")
-        if event_type in {"response.audio.delta", "response.output_audio.delta"}:
-            return data.get("delta")
         delta = data.get("delta")
+        if data.get("type") in _AUDIO_DELTA_TYPES:
+            return delta if isinstance(delta, str) else None
         if isinstance(delta, dict):
             for key in ("audio", "audio_base64"):
                 value = delta.get(key)
@@ -1,36 +1,33 @@
 from __future__ import annotations
 
-import base64
+import binascii
+import json
 from typing import Any, Dict
 
-
-def build_session_update(model: str, voice: str, sample_rate: int, instructions: str) -> Dict[str, Any]:
-    return {
-        "type": "session.update",
-        "session": {
-            "type": "realtime",
-            "model": model,
-            "output_modalities": ["audio"],
-            "audio": {
-                "input": {
-                    "format": {"type": "audio/pcm", "rate": sample_rate},
-                    "turn_detection": {"type": "semantic_vad"},
-                },
-                "output": {
-                    "format": {"type": "audio/pcm"},
-                    "voice": voice,
-                },
-            },
-            "instructions": instructions,
-        },
-    }
-
-
-def build_input_audio_append(pcm_bytes: bytes) -> Dict[str, Any]:
-    return {
-        "type": "input_audio_buffer.append",
-        "audio": base64.b64encode(pcm_bytes).decode("ascii"),
-    }
+_APPEND_PREFIX = b'{"type":"input_audio_buffer.append","audio":"'
+_APPEND_SUFFIX = b'"}'
+# Only model, rate, voice and instructions vary; string slots take json.dumps output.
+_SESSION_UPDATE_TEMPLATE = (
+    '{"type":"session.update","session":{"type":"realtime","model":%s,'
+    '"output_modalities":["audio"],"audio":{"input":{"format":{"type":"audio/pcm","rate":%d},'
+    '"turn_detection":{"type":"semantic_vad"}},"output":{"format":{"type":"audio/pcm"},"voice":%s}},'
+    '"instructions":%s}}'
+)
+
+
+def build_session_update(model: str, voice: str, sample_rate: int, instructions: str) -> bytes:
+    frame = _SESSION_UPDATE_TEMPLATE % (
+        json.dumps(model),
+        int(sample_rate),
+        json.dumps(voice),
+        json.dumps(instructions),
+    )
+    return frame.encode("ascii")
+
+
+def build_input_audio_append(pcm_bytes: bytes) -> bytes:
+    # Pre-serialized JSON: base64 output is plain ASCII and needs no escaping.
+    return _APPEND_PREFIX + binascii.b2a_base64(pcm_bytes, newline=False) + _APPEND_SUFFIX
 
 
 def build_input_audio_commit() -> Dict[str, Any]:
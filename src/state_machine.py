@@ -36,7 +36,7 @@ class HelloGptStateMachine:
     def __init__(self, config) -> None:
         self.config = config
         self.state = AppState.IDLE_LISTENING
-        self.events: "queue.Queue[Event]" = queue.Queue()
+        self.events: "queue.SimpleQueue[Event]" = queue.SimpleQueue()
         self._stop = threading.Event()
         self._realtime: Optional[RealtimeClient] = None
         self._mic_forward_sub: Optional[int] = None
@@ -115,7 +115,8 @@ class HelloGptStateMachine:
             print(f"STATE={new_state.value}", flush=True)
 
     def _handle_event(self, event: Event) -> None:
-        logger.info("EVENT=%s payload=%s", event.type, event.payload)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("EVENT=%s payload=%s", event.type, event.payload)
         if event.type == "wake.detected" and self.state == AppState.IDLE_LISTENING:
             self._start_call()
             return
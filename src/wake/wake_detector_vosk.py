@@ -20,9 +20,21 @@ logger = logging.getLogger(__name__)
 EventSink = Callable[[str, dict], None]
 Mode = Literal["idle", "in_call"]
 
+# Upper bound on audio merged into one AcceptWaveform call, to keep wake latency bounded.
+_MAX_BATCH_MS = 200
+
+
+# Single-pass normalization: drop (ASCII, no-break, full-width, zero-width) spaces and lowercase ASCII.
+_NORMALIZE_TABLE = str.maketrans(
+    {
+        **{ch: None for ch in " \t\r\n\u00a0\u200b\u3000"},
+        **{chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)},
+    }
+)
+
 
 def _normalize_text(text: str) -> str:
-    return (text or "").replace(" ", "").lower()
+    return (text or "").translate(_NORMALIZE_TABLE)
 
 
 class WakeDetectorVosk:
@@ -44,9 +56,10 @@ class WakeDetectorVosk:
         self.cooldown_sec = cooldown_sec
         self.require_consecutive_finals = max(1, require_consecutive_finals)
         self._audio_q: "queue.Queue[bytes]" = queue.Queue(maxsize=512)
+        self._max_batch_bytes = int(sample_rate * _MAX_BATCH_MS / 1000) * 2
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
-        self._mode_lock = threading.Lock()
+        # Written by set_mode, read by the recognition thread; a plain attribute store is atomic under the GIL.
         self._mode: Mode = "idle"
         self._enabled = False
         self._last_trigger_ts = 0.0
@@ -58,8 +71,7 @@ class WakeDetectorVosk:
         return self._enabled
 
     def set_mode(self, mode: Mode) -> None:
-        with self._mode_lock:
-            self._mode = mode
+        self._mode = mode
         self._wake_hits = 0
         self._exit_hits = 0
         logger.info("Wake detector mode=%s", mode)
@@ -102,10 +114,6 @@ class WakeDetectorVosk:
         self._enabled = False
         logger.info("Wake detector stopped")
 
-    def _get_mode(self) -> Mode:
-        with self._mode_lock:
-            return self._mode
-
     def _run(self) -> None:
         try:
             model = Model(self.model_path)
@@ -121,12 +129,24 @@ class WakeDetectorVosk:
                 pcm_bytes = self._audio_q.get(timeout=0.2)
             except queue.Empty:
                 continue
+            batch = [pcm_bytes]
+            batch_bytes = len(pcm_bytes)
+            while batch_bytes < self._max_batch_bytes:
+                try:
+                    chunk = self._audio_q.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(chunk)
+                batch_bytes += len(chunk)
+            if len(batch) > 1:
+                pcm_bytes = b"".join(batch)
             try:
                 is_final = recognizer.AcceptWaveform(pcm_bytes)
                 if is_final:
                     result = json.loads(recognizer.Result())
                     self._handle_transcript(result.get("text", ""), final=True)
-                else:
+                elif self._mode == "in_call":
+                    # Only finals drive wake detection, so idle mode skips building partials.
                     partial = json.loads(recognizer.PartialResult())
                     text = partial.get("partial", "")
                     if text:
@@ -143,7 +163,7 @@ class WakeDetectorVosk:
         if now - self._last_trigger_ts < self.cooldown_sec:
             return
 
-        mode = self._get_mode()
+        mode = self._mode
         if mode == "idle":
             if self.wake_phrase and self.wake_phrase in norm:
                 self._wake_hits += 1